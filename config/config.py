@@ -11,8 +11,22 @@ Attributes
 MAX_WORKERS : int
     Maximum number of concurrent workers for parallel operations. Calculated as the minimum
     of 32 or the number of CPU cores available + 4.
+MAX_IO_WORKERS : int
+    Maximum number of threads reading files concurrently. Kept small on purpose, as larger
+    pools contend for the disk and tend to make file I/O slower rather than faster.
+MATCH_BLOCK_SIZE : int
+    Maximum number of match rows compared against the data at once by the batched algorithms.
+    Each block of rows yields one block x data score matrix, dense or sparse depending on the
+    algorithm.
+MAX_SCORE_MATRIX_SIZE : int
+    Maximum number of cells of a block x data score matrix computed at once. The batched
+    algorithms reduce their block size below `MATCH_BLOCK_SIZE` to stay within it; sparse
+    matrices are bounded the same way, as they can fill up on similar strings.
 DEBUG_FLAG : bool
     Global flag to indicate if the application is in debug mode. Set to `False` by default.
+EXPORT_FORMAT : str
+    File format of the exported matching results, either `"csv"` (default) or `"parquet"`.
+    Parquet is written with pyarrow and zstd compression and is much faster for large results.
 ROOT_DIR : pathlib.Path
     Root directory of the project, determined relative to the location of this file.
 DATA_DIR : pathlib.Path
@@ -27,6 +41,9 @@ VALIDATION_DIR : pathlib.Path
     Path to the directory where files awaiting validation are stored.
 PROFILING_DIR : pathlib.Path
     Path to the 'profiling' directory, which contains profiling results.
+PROFILING_DIR_STR : str
+    String form of `PROFILING_DIR`, for building file paths with `os.path` without converting
+    the `pathlib.Path` each time.
 PROFILING_AVERAGES_DIR : pathlib.Path
     Directory for storing average profiling results.
 PROFILING_DOT_DIR : pathlib.Path
@@ -60,7 +77,11 @@ from config.dotdict import DotDict
 
 
 MAX_WORKERS = min(32, os.cpu_count() + 4)
+MAX_IO_WORKERS = 8
+MATCH_BLOCK_SIZE = 4096
+MAX_SCORE_MATRIX_SIZE = 2 ** 25
 DEBUG_FLAG = False
+EXPORT_FORMAT = "csv"
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 
@@ -70,6 +91,7 @@ RAW_DIR = INPUT_DIR / "raw"
 CLEAN_DIR = INPUT_DIR / "clean"
 VALIDATION_DIR = DATA_DIR / "await_validation"
 PROFILING_DIR = DATA_DIR / "profiling"
+PROFILING_DIR_STR = os.fspath(PROFILING_DIR)
 PROFILING_AVERAGES_DIR = PROFILING_DIR / "averages"
 PROFILING_DOT_DIR = PROFILING_DIR / "dot"
 
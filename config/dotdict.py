@@ -16,6 +16,10 @@ Examples
 >>> del d.key1            # Delete key using dot notation
 >>> print(d.get('key1'))  # Access using get method
 None
+>>> d.key1                # Missing keys raise instead of returning None
+Traceback (most recent call last):
+    ...
+AttributeError: key1
 
 Attributes
 ----------
@@ -55,7 +59,30 @@ class DotDict(dict):
         Deletes the key `name` from the dictionary.
     """
 
-    __getattr__ = dict.get
+    def __getattr__(self, name):
+        """
+        Retrieve the value associated with `name`.
+
+        Parameters
+        ----------
+        name : str
+            The key to look up.
+
+        Returns
+        -------
+        any
+            The value stored under `name`.
+
+        Raises
+        ------
+        AttributeError
+            If `name` is not a key of the dictionary.
+        """
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
     __setattr__ = dict.__setitem__
     __delattr__ = dict.__delitem__
 
@@ -57,6 +57,9 @@ class Logger:
         """
         Initialize the Logger instance.
 
+        The console handler is only attached the first time a logger with the given name is
+        created, so creating the same logger twice does not duplicate its output.
+
         Parameters
         ----------
         name : str
@@ -67,6 +70,9 @@ class Logger:
 
         self.__logger = logging.getLogger(name)
         self.__logger.setLevel(level)
+        if self.__logger.handlers:
+            return
+
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(self.__PrettyFormatter("%(message)s"))
         self.__logger.addHandler(console_handler)
@@ -81,7 +87,8 @@ class Logger:
             The message to log.
         """
 
-        self.__logger.info(f"{pformat(message)}\n")
+        if self.__logger.isEnabledFor(logging.INFO):
+            self.__logger.info("%s\n", self.__to_text(message))
 
     def debug(self, message) -> None:
         """
@@ -93,7 +100,27 @@ class Logger:
             The message to log.
         """
 
-        self.__logger.debug(f"{pformat(message)}\n")
+        if self.__logger.isEnabledFor(logging.DEBUG):
+            self.__logger.debug("%s\n", self.__to_text(message))
+
+    @staticmethod
+    def __to_text(message) -> str:
+        """
+        Convert a message to the text to be logged.
+
+        Parameters
+        ----------
+        message : any
+            The message to convert. Strings are logged as they are, any other object is
+            pretty-printed.
+
+        Returns
+        -------
+        str
+            The text to be logged.
+        """
+
+        return message if isinstance(message, str) else pformat(message)
 
     def get_name(self) -> str:
         """
@@ -12,7 +12,7 @@ __load_env()
     Loads environment variables from a `.env` file using the `dotenv` package.
 connect()
     Establishes a connection to the MongoDB database using the connection string found in
-    the environment variables.
+    the environment variables. The client is created on the first call and reused afterwards.
 
 Examples
 --------
@@ -41,6 +41,9 @@ from dotenv import load_dotenv
 from pymongo import MongoClient
 
 
+__client: MongoClient | None = None
+
+
 def __load_env():
     """
     Load environment variables from a `.env` file.
@@ -68,6 +71,9 @@ def connect():
     and uses it to create a `MongoClient` instance. The connection string must be stored
     under the environment variable `MONGODB_CONNECTION_STRING` in the `.env` file.
 
+    The client is created on the first call only; subsequent calls return the same instance,
+    so the `.env` file is parsed and the connection pool is set up once per process.
+
     Parameters
     ----------
     None
@@ -83,9 +89,12 @@ def connect():
         If the connection string is not found in the environment variables or if there is an error
         while establishing the connection.
     """
-    __load_env()
-    uri = os.getenv("MONGODB_CONNECTION_STRING")
-    return MongoClient(uri)
+    global __client
+    if __client is None:
+        __load_env()
+        uri = os.getenv("MONGODB_CONNECTION_STRING")
+        __client = MongoClient(uri)
+    return __client
 
 
 if __name__ == '__main__':
@@ -9,6 +9,8 @@ Attributes
 ----------
 __name : str
     Name of the profiler, used as a prefix for the output profiling file.
+__path : str
+    Path of the output profiling file, computed once on initialization.
 
 Methods
 -------
@@ -28,10 +30,11 @@ SystemExit
 """
 
 
+import os
 import cProfile
 import pstats
 
-from config.config import PROFILING_DIR
+from config.config import PROFILING_DIR_STR
 
 
 class Profiler(cProfile.Profile):
@@ -69,6 +72,7 @@ class Profiler(cProfile.Profile):
             results file in the `PROFILING_DIR` directory.
         """
         self.__name = name
+        self.__path = os.path.join(PROFILING_DIR_STR, f"{name}_profiling.prof")
         super().__init__()
 
     def _save_profile(self):
@@ -86,14 +90,14 @@ class Profiler(cProfile.Profile):
         -------
         None
         """
-        self.dump_stats(PROFILING_DIR.joinpath(f"{self.__name}_profiling.prof"))
+        self.dump_stats(self.__path)
 
     def _show_profile(self):
         """
         Display the profiling statistics sorted by cumulative time.
 
-        This method loads the profiling statistics from the saved `.prof` file and prints the top
-        10 results sorted by cumulative execution time (`cumtime`).
+        This method builds the profiling statistics directly from the collected profile data and
+        prints the top 10 results sorted by cumulative execution time (`cumtime`).
 
         Parameters
         ----------
@@ -103,7 +107,7 @@ class Profiler(cProfile.Profile):
         -------
         None
         """
-        stats = pstats.Stats(PROFILING_DIR.joinpath(f"{self.__name}_profiling.prof").__str__())
+        stats = pstats.Stats(self)
         stats.sort_stats("cumtime").print_stats(10)
 
     def save_show_profile(self):
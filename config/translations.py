@@ -5,13 +5,21 @@ Dictionary for translating German umlaut characters to their non-diacritic equiv
 Keys
 ----
 str
-    The umlaut charater to be replaced.
+    The umlaut charater to be replaced. Must be a single character, as the mapping is
+    compiled into `MUTATION_TABLE` for `str.translate`.
 Values
 ------
 str
     The corresponding non-diacritic replacement.
 """
 
+MUTATION_TABLE: dict[int, str] = str.maketrans(MUTATION_TRANSLATION)
+"""
+Translation table for `str.translate`, built once from `MUTATION_TRANSLATION`.
+
+Replaces all umlaut characters of a string in a single pass.
+"""
+
 ABBREVIATION_TRANSLATION: dict[str, str] = {"straße": "str.", "Straße": "Str."}
 
 
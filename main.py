@@ -48,8 +48,6 @@ Dependencies
 """
 
 
-import pandas as pd
-
 from config.config import RAW_DIR, DEBUG_FLAG
 from config.profiler import Profiler
 from config.logger import Logger
@@ -79,28 +77,30 @@ if __name__ == '__main__':
         prof = Profiler(name=f"{match_file_name[:13]}_{ALGORITHM.NAME}")
         prof.enable()
 
+        data, match = get_data(DEBUG_FLAG, match_file)
+
+        data = data.assign(
+            STREET=data["STREET_NAME"] + " " + data["STREET_NO"],
+            FULLNAME=data["FIRSTNAME"] + " " + data["LASTNAME"]
+        )
+
+        if "FULLNAME" not in match.columns and "FIRSTNAME" in match.columns and "LASTNAME" in match.columns:
+            match = match.assign(FULLNAME=match["FIRSTNAME"] + " " + match["LASTNAME"])
+
+        prep_data_cache = {}
         for column in match_columns:
             log.info(f"Starting matching for {match_file_name} on column {column}")
 
             data_column = "FULLNAME" if column == "CONTACT" else column
             match_column = column
 
-            data, match = get_data(DEBUG_FLAG, match_file)
-
-            data = data.assign(
-                STREET=data["STREET_NAME"] + " " + data["STREET_NO"],
-                FULLNAME=data["FIRSTNAME"] + " " + data["LASTNAME"]
-            )
-
-            if "FULLNAME" not in match.columns and "FIRSTNAME" in match.columns and "LASTNAME" in match.columns:
-                match = match.assign(FULLNAME=match["FIRSTNAME"] + " " + match["LASTNAME"])
-
-            prep_data = preprocess(data, data_column)
+            if data_column not in prep_data_cache:
+                prep_data_cache[data_column] = preprocess(data, data_column)
+            prep_data = prep_data_cache[data_column]
             prep_match = preprocess(match, match_column)
             ALGORITHM.prep_(prep_data, prep_match)
 
-            results = ALGORITHM.perform_matching()
-            results_df = pd.DataFrame(results)
+            results_df = ALGORITHM.perform_matching()
             results_df = ALGORITHM.export_results(results_df, match_file_name, data_column)
 
         prof.disable()
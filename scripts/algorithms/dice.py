@@ -1,92 +1,85 @@
 import pandas as pd
 import numpy as np
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from tqdm import tqdm
-from sklearn.feature_extraction.text import CountVectorizer
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import HashingVectorizer
 
-from config.config import THRESHOLDS, RAW_DIR, MAX_WORKERS, DEBUG_FLAG
+from config.config import THRESHOLDS, RAW_DIR, MATCH_BLOCK_SIZE, MAX_SCORE_MATRIX_SIZE, DEBUG_FLAG
 from config.logger import Logger
 from utils.io import export_data_for_validation
 
 
 NAME = "dice"
 match_ngrams_matrix = None
-match_original_series = None
+match_original_arr = None
 data_ngrams_matrix = None
-data_original_series = None
+data_original_arr = None
 n = 2  # Always bigram for dice coefficient
 indices = None
 
 
-def __dice_coefficient(match_vector, data_vectors):
-    intersection = data_vectors.multiply(match_vector).sum(axis=1)
+def __dice_coefficients(data_vectors, data_sizes, match_vectors):
+    intersection = (match_vectors @ data_vectors.T).tocsr()
+    intersection.sort_indices()
+    match_sizes = match_vectors.getnnz(axis=1)
 
-    match_size = match_vector.sum()
-    data_sizes = data_vectors.sum(axis=1)
+    # Only pairs sharing at least one bigram are stored, every other pair has a coefficient of 0.
+    # The coefficients are computed in place in one float buffer, which becomes the data of the result
+    dice_coefficients = data_sizes.take(intersection.indices)
+    dice_coefficients += np.repeat(match_sizes, np.diff(intersection.indptr))
+    np.divide(intersection.data, dice_coefficients, out=dice_coefficients)
+    dice_coefficients *= 2
 
-    numerator = 2 * intersection
-    denominator = match_size + data_sizes
-
-    with np.errstate(divide="ignore", invalid="ignore"):
-        dice_coefficients = numerator / denominator
-        dice_coefficients = np.nan_to_num(dice_coefficients)
-
-    return np.asarray(dice_coefficients).flatten()
-
-
-def __calculate_best_match(idx):
-    match_original = match_original_series.iloc[idx]
-    match_vector = match_ngrams_matrix[idx]
-
-    if match_vector.nnz == 0:
-        return {
-            "MATCH": match_original,
-            "BEST_FOUND_MATCH": None,
-            "TRUE_MATCH": None,
-            "BEST_MATCH": None,
-        }
-
-    dice_coefficients = __dice_coefficient(match_vector, data_ngrams_matrix)
-    max_similarity_idx = dice_coefficients.argmax()
-    max_similarity = dice_coefficients[max_similarity_idx]
-    best_match_original = data_original_series.iloc[max_similarity_idx]
-
-    return {
-        "MATCH": match_original,
-        "BEST_FOUND_MATCH": best_match_original,
-        "TRUE_MATCH": None,
-        "BEST_MATCH": max_similarity,
-    }
+    return csr_matrix((dice_coefficients, intersection.indices, intersection.indptr), shape=intersection.shape), match_sizes
 
 
 def perform_matching():
-    results = []
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {executor.submit(__calculate_best_match, idx): idx for idx in indices}
-        for future in tqdm(as_completed(futures), total=len(futures), desc="Matching", unit="match"):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                print(f"Exception occurred for index {futures[future]}: {e}")
-    return results
+    data_vectors = data_ngrams_matrix.astype(np.int32)
+    match_vectors = match_ngrams_matrix.astype(np.int32)
+    data_sizes = data_vectors.getnnz(axis=1).astype(np.float64)
+
+    # The sparse coefficient matrix of a block can hold up to block x data entries, so fewer rows are
+    # taken the more data there is
+    block_size = max(1, min(MATCH_BLOCK_SIZE, MAX_SCORE_MATRIX_SIZE // max(1, data_vectors.shape[0])))
+
+    best_found_matches = np.full(len(indices), None, dtype=object)
+    best_matches = np.full(len(indices), np.nan)
+    for start in range(0, len(indices), block_size):
+        block = slice(start, start + block_size)
+        dice_coefficients, match_sizes = __dice_coefficients(data_vectors, data_sizes, match_vectors[block])
+        best_match_indices = np.asarray(dice_coefficients.argmax(axis=1)).ravel()
+
+        # Rows without any bigram have nothing to compare and keep the None/NaN defaults
+        found = match_sizes > 0
+        best_found_matches[block][found] = data_original_arr[best_match_indices[found]]
+        best_matches[block][found] = dice_coefficients.max(axis=1).toarray().ravel()[found]
+
+    return pd.DataFrame({
+        "MATCH": match_original_arr[indices],
+        "BEST_FOUND_MATCH": best_found_matches,
+        "TRUE_MATCH": None,
+        "BEST_MATCH": best_matches,
+    })
 
 
 def prep_(data: tuple[pd.DataFrame, pd.Series, pd.Series], match: tuple[pd.DataFrame, pd.Series, pd.Series]):
-    global match_ngrams_matrix, match_original_series, data_ngrams_matrix, data_original_series, n, indices
+    global match_ngrams_matrix, match_original_arr, data_ngrams_matrix, data_original_arr, n, indices
     data_df, data_norm_series, data_original_series = data
     match_df, match_norm_series, match_original_series = match
 
-    vectorizer = CountVectorizer(analyzer="char", ngram_range=(n, n), binary=False)
+    vectorizer = HashingVectorizer(analyzer="char", ngram_range=(n, n), n_features=2 ** 20, binary=True,
+                                   alternate_sign=False, norm=None, dtype=np.uint8)
     indices = match_df.index.tolist()
-
-    all_texts = pd.concat([data_norm_series, match_norm_series])
-    vectorizer.fit(all_texts)
+    match_original_arr = match_original_series.to_numpy()
+    data_original_arr = data_original_series.to_numpy()
 
     data_ngrams_matrix = vectorizer.transform(data_norm_series)
     match_ngrams_matrix = vectorizer.transform(match_norm_series)
 
+    for matrix in (data_ngrams_matrix, match_ngrams_matrix):
+        matrix.sum_duplicates()
+        matrix.eliminate_zeros()
+
 
 def export_results(df, match_file_name, data_column) -> pd.DataFrame:
     df["BEST_MATCH_BINARY"] = df["BEST_MATCH"] >= THRESHOLDS.dice
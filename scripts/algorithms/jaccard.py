@@ -1,82 +1,83 @@
 import pandas as pd
 import numpy as np
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from tqdm import tqdm
-from sklearn.feature_extraction.text import CountVectorizer
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import HashingVectorizer
 
-from config.config import THRESHOLDS, RAW_DIR, MAX_WORKERS, DEBUG_FLAG
+from config.config import THRESHOLDS, RAW_DIR, MATCH_BLOCK_SIZE, MAX_SCORE_MATRIX_SIZE, DEBUG_FLAG
 from config.logger import Logger
 from utils.io import export_data_for_validation
 
 
 NAME = "jaccard"
 match_norm_series = None
-match_original_series = None
-data_original_series = None
+match_original_arr = None
+data_original_arr = None
 data_vectors = None
-vectorizer = None
+data_sizes = None
+match_vectors = None
 indices = None
 
 
-def __calculate_best_match(idx):
-    match_original = match_original_series.iloc[idx]
-    match_norm = match_norm_series.iloc[idx]
-    s1_clean = match_norm.strip()
+def __jaccard_similarities(data_vectors, data_sizes, match_vectors):
+    intersection = (match_vectors @ data_vectors.T).tocsr()
+    intersection.sort_indices()
+    match_sizes = match_vectors.getnnz(axis=1)
 
-    if not s1_clean:
-        return {
-            "MATCH": match_original,
-            "BEST_FOUND_MATCH": None,
-            "TRUE_MATCH": None,
-            "BEST_MATCH": None,
-        }
+    # Only pairs sharing at least one token are stored, every other pair has a similarity of 0.
+    # The similarities are computed in place in one float buffer holding the union first
+    jaccard_similarities = data_sizes.take(intersection.indices)
+    jaccard_similarities += np.repeat(match_sizes, np.diff(intersection.indptr))
+    jaccard_similarities -= intersection.data
+    np.divide(intersection.data, jaccard_similarities, out=jaccard_similarities)
 
-    match_vector = vectorizer.transform([s1_clean])
-
-    intersection = data_vectors.multiply(match_vector).sum(axis=1)
-    union = data_vectors.sum(axis=1) + match_vector.sum() - intersection
-
-    with np.errstate(divide="ignore", invalid="ignore"):
-        jaccard_similarities = intersection / union
-        jaccard_similarities = jaccard_similarities.A1
-        jaccard_similarities = np.nan_to_num(jaccard_similarities)
-
-    max_similarity = jaccard_similarities.max()
-    best_match_idx = jaccard_similarities.argmax()
-    best_match_original = data_original_series.iloc[best_match_idx]
-
-    return {
-        "MATCH": match_original,
-        "BEST_FOUND_MATCH": best_match_original,
-        "TRUE_MATCH": None,
-        "BEST_MATCH": max_similarity,
-    }
+    return csr_matrix((jaccard_similarities, intersection.indices, intersection.indptr), shape=intersection.shape), match_sizes
 
 
 def perform_matching():
-    results = []
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {executor.submit(__calculate_best_match, idx): idx for idx in indices}
-        for future in tqdm(as_completed(futures), total=len(futures), desc="Matching", unit="match"):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                print(f"Exception occurred for index {futures[future]}: {e}")
-        return results
+    data_int_vectors = data_vectors.astype(np.int32)
+    match_int_vectors = match_vectors.astype(np.int32)
+
+    # The sparse similarity matrix of a block can hold up to block x data entries, so fewer rows are
+    # taken the more data there is
+    block_size = max(1, min(MATCH_BLOCK_SIZE, MAX_SCORE_MATRIX_SIZE // max(1, data_vectors.shape[0])))
+
+    best_found_matches = np.full(len(indices), None, dtype=object)
+    best_matches = np.full(len(indices), np.nan)
+    for start in range(0, len(indices), block_size):
+        block = slice(start, start + block_size)
+        jaccard_similarities, match_sizes = __jaccard_similarities(data_int_vectors, data_sizes, match_int_vectors[block])
+        best_match_indices = np.asarray(jaccard_similarities.argmax(axis=1)).ravel()
+
+        # Rows without any token have nothing to compare and keep the None/NaN defaults
+        found = match_sizes > 0
+        best_found_matches[block][found] = data_original_arr[best_match_indices[found]]
+        best_matches[block][found] = jaccard_similarities.max(axis=1).toarray().ravel()[found]
+
+    return pd.DataFrame({
+        "MATCH": match_original_arr[indices],
+        "BEST_FOUND_MATCH": best_found_matches,
+        "TRUE_MATCH": None,
+        "BEST_MATCH": best_matches,
+    })
 
 
 def prep_(data: tuple[pd.DataFrame, pd.Series, pd.Series], match: tuple[pd.DataFrame, pd.Series, pd.Series]):
-    global match_norm_series, match_original_series, data_original_series, data_vectors, vectorizer, indices
+    global match_norm_series, match_original_arr, data_original_arr, data_vectors, data_sizes, match_vectors, indices
     data_df, data_norm_series, data_original_series = data
     match_df, match_norm_series, match_original_series = match
 
-    vectorizer = CountVectorizer(binary=True)
+    vectorizer = HashingVectorizer(n_features=2 ** 20, binary=True, alternate_sign=False, norm=None, dtype=np.uint8)
     indices = match_df.index.tolist()
+    match_original_arr = match_original_series.to_numpy()
+    data_original_arr = data_original_series.to_numpy()
 
-    vectorizer.fit(data_norm_series)
     data_vectors = vectorizer.transform(data_norm_series)
+    match_vectors = vectorizer.transform(match_norm_series)
+    for matrix in (data_vectors, match_vectors):
+        matrix.sum_duplicates()
+        matrix.eliminate_zeros()
+    data_sizes = data_vectors.getnnz(axis=1).astype(np.float64)
 
 
 def export_results(df, match_file_name, data_column) -> pd.DataFrame:
@@ -88,4 +89,3 @@ if __name__ == '__main__':
     log = Logger(__name__)
     log.info(f"Please run this algorithm via main.py, the unittest or use one of the jupyter notebooks!")
     exit(1)
-
@@ -1,82 +1,104 @@
 import pandas as pd
+import numpy as np
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 from rapidfuzz import process
 from rapidfuzz.distance import Levenshtein
 
-from config.config import THRESHOLDS, RAW_DIR, MAX_WORKERS, DEBUG_FLAG
+from config.config import THRESHOLDS, RAW_DIR, MAX_WORKERS, MATCH_BLOCK_SIZE, MAX_SCORE_MATRIX_SIZE, DEBUG_FLAG
 from config.logger import Logger
 from utils.io import export_data_for_validation
 
 
 NAME = "levenshtein"
-match_norm_series: pd.Series = None
-match_original_series: pd.Series = None
-data_norm_series: pd.Series = None
-data_original_series: pd.Series = None
+match_norm_list: list = None
+match_original_arr = None
+data_norm_list: list = None
+data_original_arr = None
+data_order = None
+data_lens_sorted = None
 indices = None
 
 
-def __calculate_best_match(idx):
-    match_original = match_original_series.iloc[idx]
-    match_norm = match_norm_series.iloc[idx]
-    s1_clean = match_norm.strip()
-
-    if not s1_clean:
-        return {
-            "MATCH": match_original,
-            "BEST_FOUND_MATCH": None,
-            "TRUE_MATCH": None,
-            "BEST_MATCH": None,
-        }
-
-    best_match = process.extractOne(
-        s1_clean,
-        data_norm_series,
-        scorer=Levenshtein.normalized_similarity,
-        processor=None
-    )
-
-    if best_match:
-        best_match_idx = best_match[2]
-        best_match_score = best_match[1]
-        best_match_original = data_original_series.iloc[best_match_idx]
-
-        return {
-            "MATCH": match_original,
-            "BEST_FOUND_MATCH": best_match_original,
-            "TRUE_MATCH": None,
-            "BEST_MATCH": best_match_score,
-        }
-    else:
-        return {
-            "MATCH": match_original,
-            "BEST_FOUND_MATCH": None,
-            "TRUE_MATCH": None,
-            "BEST_MATCH": None,
-        }
+def __length_window(length):
+    # The normalized similarity of two strings is at most min(len) / max(len), so only data strings
+    # with a length in [length * threshold, length / threshold] can reach the threshold
+    threshold = THRESHOLDS.levenshtein
+    if threshold <= 0:
+        return np.sort(data_order)
+    lo = np.searchsorted(data_lens_sorted, np.floor(length * threshold), side="left")
+    hi = np.searchsorted(data_lens_sorted, np.ceil(length / threshold), side="right")
+    return np.sort(data_order[lo:hi])
 
 
 def perform_matching():
-    results = []
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {executor.submit(__calculate_best_match, idx): idx for idx in indices}
-        for future in tqdm(as_completed(futures), total=len(futures), desc="Matching", unit="match"):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                print(f"Exception occurred for index {futures[future]}: {e}")
-        return results
+    match_lens = np.fromiter(map(len, match_norm_list), dtype=np.int64, count=len(match_norm_list))
+    match_order = np.argsort(match_lens, kind="stable")
+    groups = np.split(match_order, np.flatnonzero(np.diff(match_lens[match_order])) + 1)
+
+    # rapidfuzz turns the cutoff into a distance bound whose rounding can drop pairs scoring exactly
+    # the threshold, so the cutoff is lowered by a tolerance far below any distinct score difference
+    score_cutoff = max(0.0, THRESHOLDS.levenshtein - 1e-6)
+
+    best_found_matches = np.full(len(indices), None, dtype=object)
+    best_matches = np.full(len(indices), np.nan)
+    progress = tqdm(total=len(indices), desc="Matching", unit="match")
+    for group in groups:
+        if group.size == 0:
+            continue
+
+        candidates = __length_window(match_lens[group[0]])
+        candidate_list = [data_norm_list[i] for i in candidates]
+        block_size = max(1, min(MATCH_BLOCK_SIZE, MAX_SCORE_MATRIX_SIZE // max(1, len(candidates))))
+
+        for start in range(0, len(group), block_size):
+            block = group[start:start + block_size]
+            if not candidates.size:
+                progress.update(len(block))
+                continue
+
+            scores = process.cdist(
+                [match_norm_list[pos] for pos in block],
+                candidate_list,
+                scorer=Levenshtein.normalized_similarity,
+                processor=None,
+                score_cutoff=score_cutoff,
+                dtype=np.float64,
+                workers=MAX_WORKERS
+            )
+            best_candidates = scores.argmax(axis=1)
+            block_best_matches = scores[np.arange(len(block)), best_candidates]
+
+            # Scores below the cutoff are reported as 0, so a best score of 0 means no candidate qualified
+            found = (block_best_matches > 0) & np.array([bool(match_norm_list[pos].strip()) for pos in block])
+            best_found_matches[block[found]] = data_original_arr[candidates[best_candidates[found]]]
+            best_matches[block[found]] = block_best_matches[found]
+            progress.update(len(block))
+    progress.close()
+
+    return pd.DataFrame({
+        "MATCH": match_original_arr[indices],
+        "BEST_FOUND_MATCH": best_found_matches,
+        "TRUE_MATCH": None,
+        "BEST_MATCH": best_matches,
+    })
 
 
 def prep_(data: tuple[pd.DataFrame, pd.Series, pd.Series], match: tuple[pd.DataFrame, pd.Series, pd.Series]):
-    global match_norm_series, match_original_series, data_norm_series, data_original_series, indices
+    global match_norm_list, match_original_arr, data_norm_list, data_original_arr, indices
+    global data_order, data_lens_sorted
     data_df, data_norm_series, data_original_series = data
     match_df, match_norm_series, match_original_series = match
 
     indices = match_df.index.tolist()
+    match_original_arr = match_original_series.to_numpy()
+    data_original_arr = data_original_series.to_numpy()
+    match_norm_list = match_norm_series.tolist()
+    data_norm_list = data_norm_series.tolist()
+
+    data_lens = np.fromiter(map(len, data_norm_list), dtype=np.int64, count=len(data_norm_list))
+    data_order = np.argsort(data_lens, kind="stable")
+    data_lens_sorted = data_lens[data_order]
 
 
 def export_results(df, match_file_name, data_column) -> pd.DataFrame:
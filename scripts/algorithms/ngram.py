@@ -1,98 +1,92 @@
 import pandas as pd
 import numpy as np
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
-from sklearn.feature_extraction.text import CountVectorizer
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import HashingVectorizer
 
-from config.config import THRESHOLDS, RAW_DIR, MAX_WORKERS, DEBUG_FLAG
+from config.config import THRESHOLDS, RAW_DIR, MATCH_BLOCK_SIZE, MAX_SCORE_MATRIX_SIZE, DEBUG_FLAG
 from config.logger import Logger
 from utils.io import export_data_for_validation
 
 
 NAME: str = "ngram"
 match_ngrams_matrix = None
-match_original_series: pd.Series = None
+match_original_arr = None
 data_ngrams_matrix = None
-data_original_series: pd.Series = None
+data_original_arr = None
+data_sizes = None
+match_sizes = None
 indices: list = None
 n: int = 2
 
 
-def __ngram_similarity(match_vector, data_vectors):
-    intersection = data_vectors.multiply(match_vector).sum(axis=1)
-    match_size = match_vector.sum()
-    data_sizes = data_vectors.sum(axis=1)
+def __ngram_similarities(inverted_index, match_vectors, match_sizes):
+    intersection = (match_vectors @ inverted_index).tocsr()
+    intersection.sort_indices()
 
-    intersection = np.asarray(intersection).flatten()
-    data_sizes = np.asarray(data_sizes).flatten()
+    # Only pairs sharing at least one n-gram are stored, every other pair has a similarity of 0.
+    # The similarities are computed in place in one float buffer holding the union first
+    similarities = data_sizes.take(intersection.indices)
+    similarities += np.repeat(match_sizes, np.diff(intersection.indptr))
+    similarities -= intersection.data
+    np.divide(intersection.data, similarities, out=similarities)
 
-    union = match_size + data_sizes - intersection
-
-    with np.errstate(divide="ignore", invalid="ignore"):
-        similarities = intersection / union
-        similarities = np.nan_to_num(similarities)
-
-    return similarities
-
-
-def __calculate_best_match(idx):
-    try:
-        match_original = match_original_series.iloc[idx]
-        match_vector = match_ngrams_matrix[idx]
-
-        if match_vector.nnz == 0:
-            return {
-                "MATCH": match_original,
-                "BEST_FOUND_MATCH": None,
-                "TRUE_MATCH": None,
-                "BEST_MATCH": None,
-            }
-
-        similarities = __ngram_similarity(match_vector, data_ngrams_matrix)
-
-        max_similarity_idx = similarities.argmax()
-        max_similarity = similarities[max_similarity_idx]
-        best_match_original = data_original_series.iloc[max_similarity_idx]
-
-        return {
-            "MATCH": match_original,
-            "BEST_FOUND_MATCH": best_match_original,
-            "TRUE_MATCH": None,
-            "BEST_MATCH": max_similarity,
-        }
-    except Exception as e:
-        print(f"Error in calculate_best_match at index {idx}: {e}")
-        raise
+    return csr_matrix((similarities, intersection.indices, intersection.indptr), shape=intersection.shape)
 
 
 def perform_matching():
-    results = []
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {executor.submit(__calculate_best_match, idx): idx for idx in indices}
-        for future in tqdm(as_completed(futures), total=len(futures), desc="Matching", unit="match"):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                print(f"Exception occurred for index {futures[future]}: {e}")
-    return results
+    # Widen the 1-byte presence flags so the intersection counts of the product cannot overflow
+    data_vectors = data_ngrams_matrix.astype(np.int32)
+    match_vectors = match_ngrams_matrix.astype(np.int32)
+    # Row i lists the data strings containing n-gram i; built once instead of converting data.T per block
+    inverted_index = data_vectors.T.tocsr()
+    # The sparse similarity matrix of a block can hold up to block x data entries, so fewer rows are
+    # taken the more data there is
+    block_size = max(1, min(MATCH_BLOCK_SIZE, MAX_SCORE_MATRIX_SIZE // max(1, data_vectors.shape[0])))
+
+    best_found_matches = np.full(len(indices), None, dtype=object)
+    best_matches = np.full(len(indices), np.nan)
+    for start in tqdm(range(0, len(indices), block_size), desc="Matching", unit="block"):
+        block = slice(start, start + block_size)
+        similarities = __ngram_similarities(inverted_index, match_vectors[block], match_sizes[block])
+        best_match_indices = np.asarray(similarities.argmax(axis=1)).ravel()
+
+        # Rows without any n-gram have nothing to compare and keep the None/NaN defaults
+        found = match_sizes[block] > 0
+        best_found_matches[block][found] = data_original_arr[best_match_indices[found]]
+        best_matches[block][found] = similarities.max(axis=1).toarray().ravel()[found]
+
+    return pd.DataFrame({
+        "MATCH": match_original_arr[indices],
+        "BEST_FOUND_MATCH": best_found_matches,
+        "TRUE_MATCH": None,
+        "BEST_MATCH": best_matches,
+    })
 
 
 def prep_(data: tuple[pd.DataFrame, pd.Series, pd.Series], match: tuple[pd.DataFrame, pd.Series, pd.Series]):
-    global match_ngrams_matrix, match_original_series, data_ngrams_matrix, data_original_series, n, indices
+    global match_ngrams_matrix, match_original_arr, data_ngrams_matrix, data_original_arr, n, indices
+    global match_sizes, data_sizes
     data_df, data_norm_series, data_original_series = data
     match_df, match_norm_series, match_original_series = match
 
-    vectorizer = CountVectorizer(analyzer="char", ngram_range=(n, n), binary=False)
+    vectorizer = HashingVectorizer(analyzer="char", ngram_range=(n, n), n_features=2 ** 20, binary=True,
+                                   alternate_sign=False, norm=None, dtype=np.uint8)
     indices = match_df.index.tolist()
-
-    all_texts = pd.concat([data_norm_series, match_norm_series], ignore_index=True)
-    vectorizer.fit(all_texts)
+    match_original_arr = match_original_series.to_numpy()
+    data_original_arr = data_original_series.to_numpy()
 
     data_ngrams_matrix = vectorizer.transform(data_norm_series)
     match_ngrams_matrix = vectorizer.transform(match_norm_series)
 
+    for matrix in (data_ngrams_matrix, match_ngrams_matrix):
+        matrix.sum_duplicates()
+        matrix.eliminate_zeros()
+
+    data_sizes = data_ngrams_matrix.getnnz(axis=1).astype(np.float64)
+    match_sizes = match_ngrams_matrix.getnnz(axis=1)
+
 
 def export_results(df, match_file_name, data_column) -> pd.DataFrame:
     df["BEST_MATCH_BINARY"] = df["BEST_MATCH"] >= THRESHOLDS.ngram
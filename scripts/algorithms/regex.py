@@ -1,82 +1,93 @@
-import re
-
 import pandas as pd
 import numpy as np
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from bisect import bisect_right
+from itertools import accumulate
 from tqdm import tqdm
 
-from config.config import THRESHOLDS, RAW_DIR, MAX_WORKERS
+from config.config import THRESHOLDS, RAW_DIR
 from config.logger import Logger
 from utils.io import export_data_for_validation
 
 
 NAME = "regex"
-match_norm_series: pd.Series = None
-match_original_series: pd.Series = None
-data_norm_series: pd.Series = None
-data_original_series: pd.Series = None
-data_norm_array_lower = None
+match_norm_lower_arr = None
+match_original_arr = None
+data_original_arr = None
+data_first_index: dict = None
+data_haystack: str = None
+data_offsets: list = None
 indices = None
 
 
-def __regex_matching(s1_clean, s2_series):
-    pattern = re.compile(re.escape(s1_clean), re.IGNORECASE)
-    return s2_series.str.contains(pattern, regex=True)
+def __regex_matching(s1_lower):
+    # The haystack joins every data string with a separator the normalized text never contains, so the
+    # first hit lies in the first data string containing s1_lower
+    position = data_haystack.find(s1_lower)
+    if position < 0 or not data_offsets:
+        return None
+    return bisect_right(data_offsets, position) - 1
 
 
-def __reverse_regex_matching(s1_clean):
-    s1_lower = s1_clean.lower()
-    positions = np.char.find(s1_lower, data_norm_array_lower)
-    return positions >= 0
+def __reverse_regex_matching(s1_lower):
+    # A data string is contained in s1_lower exactly if it equals one of its substrings
+    length = len(s1_lower)
+    substrings = {s1_lower[i:j] for i in range(length + 1) for j in range(i, length + 1)}
+    positions = [data_first_index[substring] for substring in substrings if substring in data_first_index]
+    return min(positions, default=None)
 
 
 def __calculate_best_match(idx):
-    match_original = match_original_series.iloc[idx]
-    match_norm = match_norm_series.iloc[idx]
-    s1_clean = match_norm
-
-    s1_in_s2 = __regex_matching(s1_clean, data_norm_series)
-    s2_in_s1 = __reverse_regex_matching(s1_clean)
-    mask = s1_in_s2 | s2_in_s1
-    matches = data_original_series[mask]
-
-    if not matches.empty:
-        best_match = matches.iloc[0]
-        score = True
-    else:
-        best_match = None
-        score = False
-
-    return {
-        "MATCH": match_original,
-        "BEST_FOUND_MATCH": best_match,
-        "TRUE_MATCH": None,
-        "BEST_MATCH": score
-    }
+    s1_lower = match_norm_lower_arr[idx]
+
+    s1_in_s2 = __regex_matching(s1_lower)
+    s2_in_s1 = __reverse_regex_matching(s1_lower)
+    candidates = [pos for pos in (s1_in_s2, s2_in_s1) if pos is not None]
+
+    return min(candidates, default=None)
 
 
 def perform_matching():
-    results = []
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {executor.submit(__calculate_best_match, idx): idx for idx in indices}
-        for future in tqdm(as_completed(futures), total=len(futures), desc="Matching", unit="match"):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                print(f"Exception occurred for index {futures[future]}: {e}")
-        return results
+    best_found_matches = np.full(len(indices), None, dtype=object)
+    best_matches = np.zeros(len(indices), dtype=bool)
+    progress = tqdm(indices, desc="Matching", unit="match",
+                    mininterval=0.5, miniters=max(1, len(indices) // 200), smoothing=0)
+    for pos, idx in enumerate(progress):
+        try:
+            best_match_index = __calculate_best_match(idx)
+        except Exception as e:
+            print(f"Exception occurred for index {idx}: {e}")
+            continue
+
+        if best_match_index is not None:
+            best_found_matches[pos] = data_original_arr[best_match_index]
+            best_matches[pos] = True
+
+    return pd.DataFrame({
+        "MATCH": match_original_arr[indices],
+        "BEST_FOUND_MATCH": best_found_matches,
+        "TRUE_MATCH": None,
+        "BEST_MATCH": best_matches,
+    })
 
 
 def prep_(data: tuple[pd.DataFrame, pd.Series, pd.Series], match: tuple[pd.DataFrame, pd.Series, pd.Series]):
-    global match_norm_series, match_original_series, data_norm_series, data_original_series, data_norm_array_lower, indices
+    global match_norm_lower_arr, match_original_arr, data_original_arr, data_first_index, indices
+    global data_haystack, data_offsets
     data_df, data_norm_series, data_original_series = data
     match_df, match_norm_series, match_original_series = match
 
     indices = match_df.index.tolist()
-
-    data_norm_array_lower = data_norm_series.str.lower().values.astype(str)
+    match_norm_lower_arr = match_norm_series.str.lower().to_numpy()
+    match_original_arr = match_original_series.to_numpy()
+    data_original_arr = data_original_series.to_numpy()
+
+    data_norm_list_lower = data_norm_series.str.lower().tolist()
+    data_first_index = {}
+    for pos, s in enumerate(data_norm_list_lower):
+        data_first_index.setdefault(s, pos)
+    data_haystack = "\x00".join(data_norm_list_lower)
+    data_offsets = list(accumulate((len(s) + 1 for s in data_norm_list_lower), initial=0))[:-1]
 
 
 def export_results(df, match_file_name, data_column) -> pd.DataFrame:
@@ -1,72 +1,60 @@
 import pandas as pd
+import numpy as np
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from tqdm import tqdm
+from itertools import chain
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
-from config.config import THRESHOLDS, RAW_DIR, MAX_WORKERS, DEBUG_FLAG
+from config.config import THRESHOLDS, RAW_DIR, MATCH_BLOCK_SIZE, MAX_SCORE_MATRIX_SIZE, DEBUG_FLAG
 from config.logger import Logger
 from utils.io import export_data_for_validation
 
 
 NAME = "tfidf"
 match_tfidf_matrix = None
-match_original_series = None
+match_original_arr = None
 data_tfidf_matrix = None
-data_original_series = None
+data_original_arr = None
 indices = None
 
 
-def __calculate_best_match(idx):
-    match_original = match_original_series.iloc[idx]
-    match_vector = match_tfidf_matrix[idx]
-
-    if match_vector.nnz == 0:
-        return {
-            "MATCH": match_original,
-            "BEST_FOUND_MATCH": None,
-            "TRUE_MATCH": None,
-            "BEST_MATCH": None,
-        }
-
-    similarities = cosine_similarity(match_vector, data_tfidf_matrix).flatten()
-
-    max_similarity_idx = similarities.argmax()
-    max_similarity = similarities[max_similarity_idx]
-    best_match_original = data_original_series.iloc[max_similarity_idx]
-
-    return {
-        "MATCH": match_original,
-        "BEST_FOUND_MATCH": best_match_original,
-        "TRUE_MATCH": None,
-        "BEST_MATCH": max_similarity,
-    }
-
-
 def perform_matching():
-    results = []
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {executor.submit(__calculate_best_match, idx): idx for idx in indices}
-        for future in tqdm(as_completed(futures), total=len(futures), desc="Matching", unit="match"):
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                print(f"Exception occurred for index {futures[future]}: {e}")
-        return results
+    # Each block yields a dense match x data similarity matrix, so fewer rows are taken the more data there is
+    block_size = max(1, min(MATCH_BLOCK_SIZE, MAX_SCORE_MATRIX_SIZE // max(1, data_tfidf_matrix.shape[0])))
+
+    best_found_matches = np.full(len(indices), None, dtype=object)
+    best_matches = np.full(len(indices), np.nan)
+    for start in range(0, len(indices), block_size):
+        block = slice(start, start + block_size)
+        match_vectors = match_tfidf_matrix[block]
+
+        similarities = cosine_similarity(match_vectors, data_tfidf_matrix)
+        best_match_indices = similarities.argmax(axis=1)
+
+        # Rows without any known term have nothing to compare and keep the None/NaN defaults
+        found = match_vectors.getnnz(axis=1) > 0
+        best_found_matches[block][found] = data_original_arr[best_match_indices[found]]
+        best_matches[block][found] = similarities[np.arange(len(best_match_indices)), best_match_indices][found]
+
+    return pd.DataFrame({
+        "MATCH": match_original_arr[indices],
+        "BEST_FOUND_MATCH": best_found_matches,
+        "TRUE_MATCH": None,
+        "BEST_MATCH": best_matches,
+    })
 
 
 def prep_(data: tuple[pd.DataFrame, pd.Series, pd.Series], match: tuple[pd.DataFrame, pd.Series, pd.Series]):
-    global match_tfidf_matrix, match_original_series, data_tfidf_matrix, data_original_series, indices
+    global match_tfidf_matrix, match_original_arr, data_tfidf_matrix, data_original_arr, indices
     data_df, data_norm_series, data_original_series = data
     match_df, match_norm_series, match_original_series = match
 
     vectorizer = TfidfVectorizer()
     indices = match_df.index.tolist()
+    match_original_arr = match_original_series.to_numpy()
+    data_original_arr = data_original_series.to_numpy()
 
-    all_texts = pd.concat([data_norm_series, match_norm_series])
-    vectorizer.fit(all_texts)
+    vectorizer.fit(chain(data_norm_series, match_norm_series))
 
     data_tfidf_matrix = vectorizer.transform(data_norm_series)
     match_tfidf_matrix = vectorizer.transform(match_norm_series)
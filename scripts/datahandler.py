@@ -164,7 +164,7 @@ def __aggregate_data() -> pd.DataFrame:
         A DataFrame containing the aggregated data from the MongoDB collection.
     """
     collection = __load_collection()
-    return pd.DataFrame(list(__load_collection().aggregate([MATCH_STAGE, PROJECTION_STAGE])), dtype=str)
+    return pd.DataFrame(collection.aggregate([MATCH_STAGE, PROJECTION_STAGE]), dtype=str)
 
 
 def get_data(test_flag: bool = True, file_path: PathLike[str] = None) -> tuple[pd.DataFrame, pd.DataFrame]:
@@ -44,6 +44,7 @@ Notes
 Dependencies
 ------------
 - `pandas`
+- `numpy`
 - `matplotlib`
 - `scikit-learn`
 - `config.config`
@@ -54,11 +55,11 @@ Make sure all dependencies are installed and configured correctly before running
 
 
 import pandas as pd
-import matplotlib.pyplot as plt
+import numpy as np
 
 from config.config import METRICS, THRESHOLDS, DATA_DIR
 from utils.io import load_validated_data, export_eval_data, plot_metrics, plot_confusion_matrix, _to_csv
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, confusion_matrix, roc_auc_score
+from sklearn.metrics import confusion_matrix, roc_auc_score
 
 
 if __name__ == '__main__':
@@ -77,6 +78,7 @@ if __name__ == '__main__':
             continue
 
         eval_df = pd.DataFrame(index=METRICS)
+        cm_dict = {}
         for algo in THRESHOLDS:
             y_true_col = f"{algo.upper()}_TRUE_MATCH"
             y_pred_col = f"{algo.upper()}_BEST_MATCH_BINARY"
@@ -105,52 +107,30 @@ if __name__ == '__main__':
                 print(f"Invalid labels detected in algorithm '{algo}' for dataset '{dataset_name}'. Skipping...")
                 continue
 
-            accuracy = accuracy_score(y_true, y_pred)
-            precision = precision_score(y_true, y_pred)
-            recall = recall_score(y_true, y_pred)
-            f1 = f1_score(y_true, y_pred)
+            y_true = np.asarray(y_true, dtype=np.uint8)
+            y_pred = np.asarray(y_pred, dtype=np.uint8)
+
+            # All threshold metrics follow from the confusion matrix, so the labels are only scanned once
+            cm = confusion_matrix(y_true, y_pred, labels=[0, 1])
+            tn, fp, fn, tp = cm.ravel()
+            accuracy = (tp + tn) / cm.sum()
+            precision = tp / (tp + fp) if tp + fp else 0.0
+            recall = tp / (tp + fn) if tp + fn else 0.0
+            f1 = 2 * tp / (2 * tp + fp + fn) if tp else 0.0
             roc_auc = roc_auc_score(y_true, y_pred)
 
             eval_df[algo] = [accuracy, precision, recall, f1, roc_auc]
+            cm_dict[algo] = cm
 
         if eval_df.empty:
             print(f"No evaluation data for dataset '{dataset_name}'. Skipping...")
             continue
 
         eval_df = export_eval_data(eval_df, dataset_name)
-        metrics_fig = plot_metrics(eval_df, dataset_name)
-        plt.close(metrics_fig)
-
-        cm_list = []
-        for algo in THRESHOLDS:
-            y_true_col = f"{algo.upper()}_TRUE_MATCH"
-            y_pred_col = f"{algo.upper()}_BEST_MATCH_BINARY"
-
-            if y_true_col not in DATA.columns or y_pred_col not in DATA.columns:
-                continue
-
-            y_true = DATA[y_true_col]
-            y_pred = DATA[y_pred_col]
-
-            mask = y_true.notna() & y_pred.notna()
-            y_true = y_true[mask]
-            y_pred = y_pred[mask]
-
-            if y_true.empty:
-                continue
-
-            if y_true.dtype == "object":
-                y_true = y_true.astype(bool)
-                y_pred = y_pred.astype(bool)
-
-            valid_labels = (0, 1)
-            if not set(y_true.unique()).issubset(valid_labels) or not set(y_pred.unique()).issubset(valid_labels):
-                continue
+        plot_metrics(eval_df, dataset_name)
 
-            cm = confusion_matrix(y_true, y_pred)
+        for algo, cm in cm_dict.items():
             cm_df = pd.DataFrame(cm, index=["True Negative", "True Positive"], columns=["Predicted Negative", "Predicted Positive"])
             _to_csv(cm_df, DATA_DIR.joinpath("confusion_matrices").joinpath(f"{algo}_{dataset_name}_confusion_matrix.csv"))
 
-            cm_fig = plot_confusion_matrix(cm, algo, dataset_name)
-            cm_list.append(cm_fig)
-            plt.close(cm_fig)
\ No newline at end of file
+            plot_confusion_matrix(cm, algo, dataset_name)
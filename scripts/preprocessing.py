@@ -7,8 +7,6 @@ subsequent string similarity matching and comparison.
 
 Functions
 ---------
-__normalize_text(s1)
-    Applies a series of text replacements and removes special characters from the input string.
 preprocess(df, column)
     Normalizes the specified column in a DataFrame and returns the preprocessed DataFrame along with
     the normalized and original text as separate series.
@@ -31,40 +29,9 @@ SystemExit
 
 
 
-import re
-
 import pandas as pd
 
-from functools import reduce
-from config.translations import ABBREVIATION_TRANSLATION, MUTATION_TRANSLATION
-
-
-def __normalize_text(s1: str) -> str:
-    """
-    Normalize the input text using predefined replacements and character removal.
-
-    This function performs multiple text replacements based on dictionaries defined in
-    `ABBREVIATION_TRANSLATION` and `MUTATION_TRANSLATION`. It removes special characters,
-    converts the text to lowercase, and returns the cleaned string.
-
-    Parameters
-    ----------
-    s1 : str
-        The input string to be normalized.
-
-    Returns
-    -------
-    str
-        The normalized string with abbreviations replaced and special characters removed.
-
-    Examples
-    --------
-    >>> __normalize_text("Dr. Müller-Straße 123")
-    'dr muellerstrasse 123'
-    """
-    replacements = ABBREVIATION_TRANSLATION | MUTATION_TRANSLATION
-    s2 = reduce(lambda s, kv: re.sub(kv[0], kv[1], s), replacements.items(), s1)
-    return re.sub(r"[^\w\s]", "", s2.lower().strip())
+from utils.format import normalize_series
 
 
 def preprocess(df: pd.DataFrame, column: str) -> tuple[pd.DataFrame, pd.Series, pd.Series]:
@@ -72,8 +39,9 @@ def preprocess(df: pd.DataFrame, column: str) -> tuple[pd.DataFrame, pd.Series,
     Preprocess a specified column in a DataFrame by normalizing the text.
 
     This function creates a copy of the input DataFrame, resets its index, and normalizes
-    the specified column. The function returns a tuple containing the modified DataFrame,
-    a Series of normalized text, and a Series of the original text.
+    the specified column with `utils.format.normalize_series`, which normalizes each distinct
+    value only once, exactly like `utils.format.normalize_text`. The function returns a tuple
+    containing the modified DataFrame, a Series of normalized text, and a Series of the original text.
 
     Parameters
     ----------
@@ -104,8 +72,8 @@ def preprocess(df: pd.DataFrame, column: str) -> tuple[pd.DataFrame, pd.Series,
     df_copy = df_copy.reset_index(drop=True, inplace=False)
     df_copy[column] = df_copy[column].fillna("", inplace=False)
 
-    normalized_series = df_copy[column].apply(__normalize_text)
     original_series = df_copy[column]
+    normalized_series = normalize_series(original_series)
     return df_copy, normalized_series, original_series
 
 
@@ -3,18 +3,27 @@ Profiling Graph Utility
 
 This module provides utility functions to create visual representations of profiling data.
 The functions generate graph files from profiling data, combine and average multiple profiling
-runs, and save the results in various formats. It relies on external tools like `gprof2dot`
-and `dot` to convert profiling data into graphical representations.
+runs, and save the results in various formats. It relies on `gprof2dot`, which is run
+in-process, and the external `dot` tool to convert profiling data into graphical representations.
 
 The module can be used to automate the creation of profiling graphs for performance analysis
 and comparison between different runs of a program.
 
+Attributes
+----------
+DOT_BATCH_SIZE : int
+    Maximum number of `.dot` files rendered by a single `dot` invocation.
+
 Functions
 ---------
 __makedirs()
     Creates directories for storing profiling averages, dot files, and graph files.
+__prof_to_dot(prof_path, dot_path)
+    Converts a single `.prof` file into a `.dot` file by running `gprof2dot` in-process.
 __graph_profiles(prof_dir, dot_dir, graph_dir)
     Converts profiling data from `.prof` files into `.dot` files and then generates `.png` images.
+__load_stats(prof_file, mtime)
+    Loads the raw statistics dictionary of a `.prof` file, cached by path and modification time.
 __combine_and_average_profiles(prof_files, output_file)
     Combines and averages multiple profiling statistics files into a single `.prof` file.
 __graph_average_profiles()
@@ -31,7 +40,7 @@ The functions in this module are typically called together in a sequence:
 
 Dependencies
 ------------
-- `gprof2dot` (command-line tool)
+- `gprof2dot`
 - `dot` (from Graphviz)
 
 Raises
@@ -47,11 +56,21 @@ called as a utility within other scripts or processes. It should not be run dire
 
 
 import os
-import pstats
+import marshal
+import shutil
 import subprocess
 
+import gprof2dot
+
+from collections import defaultdict
+from functools import lru_cache
 from itertools import chain
-from config.config import THRESHOLDS, PROFILING_DIR, PROFILING_AVERAGES_DIR, PROFILING_DOT_DIR, PROFILING_GRAPH_DIR
+from concurrent.futures import ProcessPoolExecutor
+from config.logger import Logger
+from config.config import THRESHOLDS, PROFILING_DIR, PROFILING_DIR_STR, PROFILING_AVERAGES_DIR, PROFILING_DOT_DIR, PROFILING_GRAPH_DIR
+
+
+DOT_BATCH_SIZE = 64
 
 
 def __makedirs():
@@ -74,13 +93,44 @@ def __makedirs():
     os.makedirs(PROFILING_GRAPH_DIR, exist_ok=True)
 
 
+def __prof_to_dot(prof_path, dot_path):
+    """
+    Convert a single profiling file into a dot file.
+
+    Parameters
+    ----------
+    prof_path : str
+        The path to the `.prof` profiling file.
+    dot_path : str
+        The path where the generated `.dot` file will be stored.
+
+    Returns
+    -------
+    bool
+        True if the dot file was written, False if the profile could not be converted.
+    """
+    # gprof2dot exits on invalid input, which must not end the conversion of the other files
+    try:
+        gprof2dot.main(["-f", "pstats", prof_path, "-o", dot_path])
+    except SystemExit as e:
+        if e.code:
+            Logger(__name__).info(f"Skipping {prof_path}, gprof2dot exited with code {e.code}.")
+            return False
+    except Exception as e:
+        Logger(__name__).info(f"Skipping {prof_path}, gprof2dot failed: {e}")
+        return False
+    return True
+
+
 def __graph_profiles(prof_dir, dot_dir, graph_dir):
     """
     Convert profiling data into dot and graph files.
 
     This function iterates through all `.prof` files in the specified profiling
-    directory, converts them to `.dot` files using `gprof2dot`, and then generates
-    `.png` graph files using the `dot` command.
+    directory and converts them to `.dot` files using `gprof2dot` in parallel worker processes.
+    The `.png` graph files are then rendered by one `dot` invocation per `DOT_BATCH_SIZE`
+    files and moved to `graph_dir`. Profiles that fail to convert and graphs that fail to
+    render are logged and skipped.
 
     Parameters
     ----------
@@ -95,25 +145,74 @@ def __graph_profiles(prof_dir, dot_dir, graph_dir):
     -------
     None
     """
-    for filename in os.listdir(prof_dir):
-        if filename.endswith(".prof"):
-            prof_path = os.path.join(prof_dir, filename)
-            dot_filename = filename.replace(".prof", ".dot")
-            dot_path = os.path.join(dot_dir, dot_filename)
-            png_filename = filename.replace(".prof", ".png")
-            png_path = os.path.join(graph_dir, png_filename)
+    dot_paths = {}
+    png_paths = {}
+    with os.scandir(prof_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".prof"):
+                dot_path = os.path.join(dot_dir, entry.name.replace(".prof", ".dot"))
+                dot_paths[entry.path] = dot_path
+                png_paths[dot_path] = os.path.join(graph_dir, entry.name.replace(".prof", ".png"))
+
+    if not png_paths:
+        return
+
+    # gprof2dot parses the profiles in Python, so the conversions are spread across worker processes
+    with ProcessPoolExecutor() as executor:
+        converted = list(executor.map(__prof_to_dot, dot_paths.keys(), dot_paths.values()))
+    png_paths = {dot_path: png_paths[dot_path] for dot_path, ok in zip(dot_paths.values(), converted) if ok}
+
+    # Each dot process renders a batch of graphs; -O writes each one next to its input as `<name>.dot.png`.
+    # The batches keep the command line well below the Windows limit of 32767 characters
+    log = Logger(__name__)
+    dot_path_list = list(png_paths)
+    for start in range(0, len(dot_path_list), DOT_BATCH_SIZE):
+        batch = dot_path_list[start:start + DOT_BATCH_SIZE]
+        result = subprocess.run(["dot", "-Tpng", "-O", *batch])
+        if result.returncode != 0:
+            log.info(f"dot exited with code {result.returncode}, some graphs of this batch may be missing.")
+
+        for dot_path in batch:
+            if not os.path.exists(f"{dot_path}.png"):
+                log.info(f"Skipping {dot_path}, dot did not render a graph for it.")
+                continue
+            os.replace(f"{dot_path}.png", png_paths[dot_path])
+
+
+@lru_cache(maxsize=None)
+def __load_stats(prof_file, mtime):
+    """
+    Load the raw statistics of a profiling file.
 
-            subprocess.run(["gprof2dot", "-f", "pstats", prof_path, "-o", dot_path])
-            subprocess.run(["dot", "-Tpng", dot_path, "-o", png_path])
+    The file is unmarshalled directly, without building a `pstats.Stats` object. The
+    result is cached per path and modification time, so a file that belongs to several
+    groups is parsed only once.
+
+    Parameters
+    ----------
+    prof_file : str
+        The path to the `.prof` profiling file.
+    mtime : float
+        The modification time of the file, used to invalidate the cache.
+
+    Returns
+    -------
+    dict
+        The statistics, mapping each function to its `(cc, nc, tt, ct, callers)` tuple.
+        They must not be modified.
+    """
+    with open(prof_file, "rb") as f:
+        return marshal.load(f)
 
 
 def __combine_and_average_profiles(prof_files, output_file):
     """
     Combine and average multiple profiling files into a single profile.
 
-    This function reads multiple profiling `.prof` files, combines their statistics,
-    and calculates the average statistics across all files. The averaged profiling
-    data is then saved to a new `.prof` file.
+    This function reads multiple profiling `.prof` files, sums the call counts and times
+    of every function and its callers, and divides them by the number of files. The
+    averaged profiling data is then saved to a new `.prof` file in the `pstats` format.
+    A single file is copied unchanged, and nothing is written for an empty list.
 
     Parameters
     ----------
@@ -126,20 +225,39 @@ def __combine_and_average_profiles(prof_files, output_file):
     -------
     None
     """
-    combined_stats = None
-
-    for prof_file in prof_files:
-        stats = pstats.Stats(prof_file)
-
-        if combined_stats is None:
-            combined_stats = stats
-        else:
-            combined_stats.add(stats)
+    if not prof_files:
+        return
 
-    combined_stats.total_calls = combined_stats.total_calls / len(prof_files)
-    combined_stats.total_tt = combined_stats.total_tt / len(prof_files)
+    output_path = PROFILING_AVERAGES_DIR.joinpath(f"{output_file}_average.prof")
+    if len(prof_files) == 1:
+        shutil.copyfile(prof_files[0], output_path)
+        return
 
-    combined_stats.dump_stats(PROFILING_AVERAGES_DIR.joinpath(f"{output_file}_average.prof"))
+    # Summing the raw tuples avoids the per-function bookkeeping of pstats.Stats.add
+    totals = defaultdict(lambda: [0, 0, 0.0, 0.0, defaultdict(lambda: [0, 0, 0.0, 0.0])])
+    for prof_file in prof_files:
+        for func, (cc, nc, tt, ct, callers) in __load_stats(prof_file, os.path.getmtime(prof_file)).items():
+            total = totals[func]
+            total[0] += cc
+            total[1] += nc
+            total[2] += tt
+            total[3] += ct
+            for caller, caller_stats in callers.items():
+                caller_total = total[4][caller]
+                for i, value in enumerate(caller_stats):
+                    caller_total[i] += value
+
+    # Call counts are rounded so the averaged profile keeps integral counts like a recorded one
+    n = len(prof_files)
+    averaged = {
+        func: (round(cc / n), round(nc / n), tt / n, ct / n, {
+            caller: (round(c_nc / n), round(c_cc / n), c_tt / n, c_ct / n)
+            for caller, (c_nc, c_cc, c_tt, c_ct) in callers.items()
+        })
+        for func, (cc, nc, tt, ct, callers) in totals.items()
+    }
+    with open(output_path, "wb") as f:
+        marshal.dump(averaged, f)
 
 
 def __graph_average_profiles():
@@ -157,10 +275,15 @@ def __graph_average_profiles():
     -------
     None
     """
-    datasets = set([f[:13] for f in os.listdir(PROFILING_DIR) if f.endswith(".prof")])
-    for group in set(chain(THRESHOLDS.keys(), datasets)):
-        prof_files = [os.path.join(PROFILING_DIR, f) for f in os.listdir(PROFILING_DIR) if
-                      f.endswith(".prof") and group in f]
+    # A single directory scan sorts every profile into its dataset prefix and the algorithms it belongs to
+    groups = defaultdict(list)
+    with os.scandir(PROFILING_DIR_STR) as entries:
+        for entry in entries:
+            if entry.name.endswith(".prof"):
+                for group in chain([entry.name[:13]], (algo for algo in THRESHOLDS if algo in entry.name)):
+                    groups[group].append(entry.path)
+
+    for group, prof_files in groups.items():
         __combine_and_average_profiles(prof_files, group)
 
     os.makedirs(PROFILING_DOT_DIR / "averages", exist_ok=True)
@@ -0,0 +1,8 @@
+import pandas as pd
+
+
+def prep_args(values):
+    norm_series = pd.Series(values, dtype=object)
+    # Distinct originals make the reported match identify the data row, not just its value
+    original_series = pd.Series([f"{pos}:{value}" for pos, value in enumerate(values)], dtype=object)
+    return pd.DataFrame(index=norm_series.index), norm_series, original_series
@@ -71,8 +71,7 @@ if __name__ == '__main__':
     case.log.info("Preparing algorithm...")
     algorithm.prep_(prep_data, prep_match)
 
-    results = case.algorithm.perform_matching()
-    results_df = pd.DataFrame(results)
+    results_df = case.algorithm.perform_matching()
 
     case.log.info("Exporting results...")
     if DEBUG_FLAG:
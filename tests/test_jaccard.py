@@ -0,0 +1,63 @@
+import random
+import re
+import unittest
+
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from scripts.algorithms import jaccard
+from tests import prep_args
+
+
+def _tokens(text):
+    # The word analyzer of the vectorizer lowercases and keeps words of at least two characters
+    return set(re.findall(r"(?u)\b\w\w+\b", text.lower()))
+
+
+def _brute_force(data, match):
+    data_tokens = [_tokens(s2) for s2 in data]
+    best_found_matches, best_matches = [], []
+    for s1 in match:
+        tokens = _tokens(s1)
+        if not tokens:
+            best_found_matches.append(None)
+            best_matches.append(np.nan)
+            continue
+        scores = [len(tokens & other) / len(tokens | other) for other in data_tokens]
+        hit = scores.index(max(scores))
+        best_found_matches.append(f"{hit}:{data[hit]}")
+        best_matches.append(scores[hit])
+    return best_found_matches, best_matches
+
+
+class JaccardMatchingTest(unittest.TestCase):
+    def assertMatchesBruteForce(self, data, match):
+        jaccard.prep_(prep_args(data), prep_args(match))
+        results_df = jaccard.perform_matching()
+
+        expected_found_matches, expected_matches = _brute_force(data, match)
+        # Missing matches are None, or NaN where pandas infers a string dtype for the column
+        best_found_matches = [None if pd.isna(value) else value for value in results_df["BEST_FOUND_MATCH"]]
+        self.assertEqual(best_found_matches, expected_found_matches)
+        np.testing.assert_array_equal(results_df["BEST_MATCH"].to_numpy(), np.array(expected_matches))
+
+    def test_ties_resolve_to_first_data_row(self):
+        self.assertMatchesBruteForce(["xy zz", "ab cd", "ab ce", "ab cd"], ["ab cf", "ab cd", "qq", "xy"])
+
+    def test_strings_without_tokens(self):
+        self.assertMatchesBruteForce(["a b", "ab", ""], ["", "a", "a b", "ab"])
+
+    def test_random_strings_in_small_blocks(self):
+        rng = random.Random(0)
+        with mock.patch.object(jaccard, "MATCH_BLOCK_SIZE", 3), mock.patch.object(jaccard, "MAX_SCORE_MATRIX_SIZE", 7):
+            words = ["ab", "cd", "üx", " "]
+            for _ in range(3):
+                data = ["".join(rng.choice(words) for _ in range(rng.randint(0, 8))) for _ in range(60)]
+                match = ["".join(rng.choice(words) for _ in range(rng.randint(0, 8))) for _ in range(40)]
+                self.assertMatchesBruteForce(data, match)
+
+
+if __name__ == '__main__':
+    unittest.main()
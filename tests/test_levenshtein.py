@@ -0,0 +1,73 @@
+import random
+import unittest
+
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from rapidfuzz.distance import Levenshtein
+
+from config.config import THRESHOLDS
+from scripts.algorithms import levenshtein
+from tests import prep_args
+
+
+def _brute_force(data, match):
+    best_found_matches, best_matches = [], []
+    for s1 in match:
+        scores = [Levenshtein.normalized_similarity(s1, s2) for s2 in data]
+        best_score = max(scores, default=0.0)
+        if not s1.strip() or best_score <= 0 or best_score < THRESHOLDS.levenshtein:
+            best_found_matches.append(None)
+            best_matches.append(np.nan)
+            continue
+        hit = scores.index(best_score)
+        best_found_matches.append(f"{hit}:{data[hit]}")
+        best_matches.append(best_score)
+    return best_found_matches, best_matches
+
+
+class LevenshteinMatchingTest(unittest.TestCase):
+    def assertMatchesBruteForce(self, data, match):
+        levenshtein.prep_(prep_args(data), prep_args(match))
+        results_df = levenshtein.perform_matching()
+
+        expected_found_matches, expected_matches = _brute_force(data, match)
+        # Missing matches are None, or NaN where pandas infers a string dtype for the column
+        best_found_matches = [None if pd.isna(value) else value for value in results_df["BEST_FOUND_MATCH"]]
+        self.assertEqual(best_found_matches, expected_found_matches)
+        np.testing.assert_array_equal(results_df["BEST_MATCH"].to_numpy(), np.array(expected_matches))
+
+    def test_ties_resolve_to_first_data_row(self):
+        self.assertMatchesBruteForce(["abcdx", "abcdy", "abcde", "abcde"], ["abcde", "abcdz", "abcdq"])
+
+    def test_empty_strings(self):
+        self.assertMatchesBruteForce(["", "a", "abc"], ["", " ", "a", "abc"])
+        self.assertMatchesBruteForce([], ["", "abc"])
+
+    def test_scores_exactly_at_threshold(self):
+        # "abcd" and "abcde" score exactly 0.8 and lie on the upper edge of the length window
+        self.assertMatchesBruteForce(["abc", "abcde"], ["abcd"])
+        with mock.patch.dict(THRESHOLDS, {"levenshtein": 0.7}):
+            self.assertMatchesBruteForce(["abcdefghij", "abcdefgxyz"], ["abcdefgqrs", "abcdefg"])
+        with mock.patch.dict(THRESHOLDS, {"levenshtein": 0.9}):
+            self.assertMatchesBruteForce(["abcdefghij", "abcdefghi"], ["abcdefghix", "abcdefghijk"])
+
+    def test_boundary_lengths(self):
+        data = ["abc", "abcd", "abcde", "abcdef", "abcdefg"]
+        self.assertMatchesBruteForce(data, ["ab", "abc", "abcd", "abcde", "abcdef", "abcdefg", "abcdefgh"])
+
+    def test_random_strings_in_small_blocks(self):
+        rng = random.Random(0)
+        with mock.patch.object(levenshtein, "MATCH_BLOCK_SIZE", 3), \
+                mock.patch.object(levenshtein, "MAX_SCORE_MATRIX_SIZE", 7):
+            for threshold in (0.5, 0.8):
+                with mock.patch.dict(THRESHOLDS, {"levenshtein": threshold}):
+                    data = ["".join(rng.choice("ab c") for _ in range(rng.randint(0, 8))) for _ in range(60)]
+                    match = ["".join(rng.choice("ab c") for _ in range(rng.randint(0, 8))) for _ in range(40)]
+                    self.assertMatchesBruteForce(data, match)
+
+
+if __name__ == '__main__':
+    unittest.main()
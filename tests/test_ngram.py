@@ -0,0 +1,63 @@
+import random
+import re
+import unittest
+
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from scripts.algorithms import ngram
+from tests import prep_args
+
+
+def _bigrams(text):
+    # The char analyzer of the vectorizer lowercases and collapses runs of whitespace
+    text = re.sub(r"\s\s+", " ", text.lower())
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _brute_force(data, match):
+    data_bigrams = [_bigrams(s2) for s2 in data]
+    best_found_matches, best_matches = [], []
+    for s1 in match:
+        bigrams = _bigrams(s1)
+        if not bigrams:
+            best_found_matches.append(None)
+            best_matches.append(np.nan)
+            continue
+        scores = [len(bigrams & other) / len(bigrams | other) for other in data_bigrams]
+        hit = scores.index(max(scores))
+        best_found_matches.append(f"{hit}:{data[hit]}")
+        best_matches.append(scores[hit])
+    return best_found_matches, best_matches
+
+
+class NgramMatchingTest(unittest.TestCase):
+    def assertMatchesBruteForce(self, data, match):
+        ngram.prep_(prep_args(data), prep_args(match))
+        results_df = ngram.perform_matching()
+
+        expected_found_matches, expected_matches = _brute_force(data, match)
+        # Missing matches are None, or NaN where pandas infers a string dtype for the column
+        best_found_matches = [None if pd.isna(value) else value for value in results_df["BEST_FOUND_MATCH"]]
+        self.assertEqual(best_found_matches, expected_found_matches)
+        np.testing.assert_array_equal(results_df["BEST_MATCH"].to_numpy(), np.array(expected_matches))
+
+    def test_ties_resolve_to_first_data_row(self):
+        self.assertMatchesBruteForce(["xyz", "abd", "abe", "abd"], ["abc", "abd", "zzz", "xy"])
+
+    def test_strings_without_bigrams(self):
+        self.assertMatchesBruteForce(["a", "ab", ""], ["", "a", "ab", "ba"])
+
+    def test_random_strings_in_small_blocks(self):
+        rng = random.Random(0)
+        with mock.patch.object(ngram, "MATCH_BLOCK_SIZE", 3), mock.patch.object(ngram, "MAX_SCORE_MATRIX_SIZE", 7):
+            for _ in range(3):
+                data = ["".join(rng.choice("ab cü") for _ in range(rng.randint(0, 8))) for _ in range(60)]
+                match = ["".join(rng.choice("ab cü") for _ in range(rng.randint(0, 8))) for _ in range(40)]
+                self.assertMatchesBruteForce(data, match)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import random
+import unittest
+
+import pandas as pd
+
+from scripts.algorithms import regex
+from tests import prep_args
+
+
+def _brute_force(data, match):
+    best_found_matches = []
+    for s1 in match:
+        s1_lower = s1.lower()
+        hit = next((pos for pos, s2 in enumerate(data) if s1_lower in s2.lower() or s2.lower() in s1_lower), None)
+        best_found_matches.append(None if hit is None else f"{hit}:{data[hit]}")
+    return best_found_matches
+
+
+class RegexMatchingTest(unittest.TestCase):
+    def assertMatchesBruteForce(self, data, match):
+        regex.prep_(prep_args(data), prep_args(match))
+        results_df = regex.perform_matching()
+
+        expected = _brute_force(data, match)
+        # Missing matches are None, or NaN where pandas infers a string dtype for the column
+        best_found_matches = [None if pd.isna(value) else value for value in results_df["BEST_FOUND_MATCH"]]
+        self.assertEqual(best_found_matches, expected)
+        self.assertEqual(results_df["BEST_MATCH"].tolist(), [hit is not None for hit in expected])
+
+    def test_ties_resolve_to_first_data_row(self):
+        self.assertMatchesBruteForce(["xabcx", "abc", "abc"], ["abc", "xabcxy", "bc"])
+        self.assertMatchesBruteForce(["zz", "abc", "abc", "ab"], ["abcd", "zabcz"])
+
+    def test_empty_strings(self):
+        self.assertMatchesBruteForce(["abc", "", "de"], ["", "abc", "xyz"])
+        self.assertMatchesBruteForce(["abc", "de"], ["", "d"])
+        self.assertMatchesBruteForce([], ["", "abc"])
+        self.assertMatchesBruteForce([""], ["", "abc"])
+
+    def test_no_match_across_data_strings(self):
+        self.assertMatchesBruteForce(["ab", "cd", "ef"], ["bc", "b", "abcd", "cdef", "de"])
+
+    def test_case_is_ignored(self):
+        self.assertMatchesBruteForce(["ABC", "Straße"], ["xabcx", "STRASSE", "straße 5"])
+
+    def test_boundary_lengths(self):
+        data = ["abcd", "abcde", "abc", "abcdef"]
+        self.assertMatchesBruteForce(data, ["abcd", "abcde", "abc", "abcdef", "abcdefg", "ab", "bcdef"])
+
+    def test_random_strings(self):
+        rng = random.Random(0)
+        for _ in range(5):
+            data = ["".join(rng.choice("ab cü") for _ in range(rng.randint(0, 6))) for _ in range(60)]
+            match = ["".join(rng.choice("ab cü") for _ in range(rng.randint(0, 6))) for _ in range(40)]
+            self.assertMatchesBruteForce(data, match)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import random
+import unittest
+
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from scripts.algorithms import tfidf
+from tests import prep_args
+
+
+def _brute_force(data, match):
+    vectorizer = TfidfVectorizer().fit([*data, *match])
+    data_vectors = vectorizer.transform(data).toarray()
+    match_vectors = vectorizer.transform(match).toarray()
+
+    best_found_matches, best_matches = [], []
+    for s1, vector in zip(match, match_vectors):
+        if not vector.any():
+            best_found_matches.append(None)
+            best_matches.append(np.nan)
+            continue
+        # The tf-idf rows are l2-normalized, so their dot product is the cosine similarity
+        scores = [float(vector @ other) for other in data_vectors]
+        hit = scores.index(max(scores))
+        best_found_matches.append(f"{hit}:{data[hit]}")
+        best_matches.append(scores[hit])
+    return best_found_matches, best_matches
+
+
+class TfidfMatchingTest(unittest.TestCase):
+    def assertMatchesBruteForce(self, data, match):
+        tfidf.prep_(prep_args(data), prep_args(match))
+        results_df = tfidf.perform_matching()
+
+        expected_found_matches, expected_matches = _brute_force(data, match)
+        # Missing matches are None, or NaN where pandas infers a string dtype for the column
+        best_found_matches = [None if pd.isna(value) else value for value in results_df["BEST_FOUND_MATCH"]]
+        self.assertEqual(best_found_matches, expected_found_matches)
+        np.testing.assert_allclose(results_df["BEST_MATCH"].to_numpy(), np.array(expected_matches), rtol=1e-12)
+
+    def test_ties_resolve_to_first_data_row(self):
+        self.assertMatchesBruteForce(["xy zz", "ab cd", "ab ce", "ab cd"], ["ab cf", "ab cd", "xy"])
+
+    def test_strings_without_known_terms(self):
+        self.assertMatchesBruteForce(["ab cd", "ef"], ["", "a", "ab"])
+
+    def test_random_strings_in_small_blocks(self):
+        rng = random.Random(0)
+        with mock.patch.object(tfidf, "MATCH_BLOCK_SIZE", 3), mock.patch.object(tfidf, "MAX_SCORE_MATRIX_SIZE", 7):
+            words = ["ab", "cd", "üx", " "]
+            for _ in range(3):
+                data = ["".join(rng.choice(words) for _ in range(rng.randint(0, 8))) for _ in range(60)]
+                match = ["".join(rng.choice(words) for _ in range(rng.randint(0, 8))) for _ in range(40)]
+                self.assertMatchesBruteForce(data, match)
+
+
+if __name__ == '__main__':
+    unittest.main()
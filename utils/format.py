@@ -10,14 +10,16 @@ Attributes
 ----------
 ABBREVIATION_TRANSLATION : dict
     A dictionary containing abbreviation replacements, loaded from `config.translations`.
-MUTATION_TRANSLATION : dict
-    A dictionary containing mutation replacements, loaded from `config.translations`.
+MUTATION_TABLE : dict
+    A `str.translate` table containing mutation replacements, loaded from `config.translations`.
 
 Functions
 ---------
 normalize_text(text)
     Normalizes the input text by applying abbreviation and mutation translations, and
     removes special characters and punctuation.
+normalize_series(series)
+    Normalizes all texts of a Series like `normalize_text`, using vectorized string operations.
 
 Raises
 ------
@@ -27,19 +29,33 @@ SystemExit
 
 
 import re
-from functools import reduce
 
-from config.translations import ABBREVIATION_TRANSLATION, MUTATION_TRANSLATION
+import pandas as pd
+
+from config.translations import ABBREVIATION_TRANSLATION, MUTATION_TABLE
+
+
+_NON_WORD_PATTERN = re.compile(r"[^\w\s]")
+# The text is lowercased before any replacement, so only lowercase abbreviations need to be matched. Their
+# replacements are stored already cleaned, as they are not scanned again by the pattern below
+_REPLACEMENTS = {
+    key.lower(): _NON_WORD_PATTERN.sub("", value.lower().translate(MUTATION_TABLE))
+    for key, value in ABBREVIATION_TRANSLATION.items()
+}
+# Abbreviations and special characters are handled in one scan; special characters map to ""
+_REPLACEMENT_PATTERN = re.compile(
+    "|".join([*map(re.escape, sorted(_REPLACEMENTS, key=len, reverse=True)), _NON_WORD_PATTERN.pattern])
+)
 
 
 def normalize_text(text: str) -> str:
     """
     Normalize the input text using predefined replacements and character removal.
 
-    This function applies a series of replacements to the input text based on
-    dictionaries `ABBREVIATION_TRANSLATION` and `MUTATION_TRANSLATION`. It replaces
-    abbreviations and mutations, removes any special characters or punctuation,
-    and converts the text to lowercase.
+    This function converts the text to lowercase first, then replaces abbreviations from
+    `ABBREVIATION_TRANSLATION` and removes any special characters or punctuation in a
+    single pass of one precompiled pattern. Mutations are replaced afterwards with the
+    `MUTATION_TABLE` translation table.
 
     Parameters
     ----------
@@ -55,11 +71,48 @@ def normalize_text(text: str) -> str:
     Examples
     --------
     >>> normalize_text("Dr. Müller-Straße 123")
-    'dr muellerstrasse 123'
+    'dr muellerstr 123'
+    """
+    text = _REPLACEMENT_PATTERN.sub(lambda m: _REPLACEMENTS.get(m.group(0), ""), text.lower().strip())
+    return text.translate(MUTATION_TABLE)
+
+
+def normalize_series(series: pd.Series) -> pd.Series:
+    """
+    Normalize all texts of a Series using predefined replacements and character removal.
+
+    This function is the vectorized counterpart of `normalize_text`. It applies the same
+    steps as a chain of `Series.str` operations instead of calling `normalize_text` per row.
+    Each distinct value is normalized only once and the result is mapped back onto all rows
+    holding it. The values are processed as Python strings, so the result is identical to
+    `series.apply(normalize_text)`.
+
+    Parameters
+    ----------
+    series : pd.Series
+        The Series of texts to be normalized.
+
+    Returns
+    -------
+    pd.Series
+        A Series of the normalized texts, with the index and name of the input.
+
+    Examples
+    --------
+    >>> normalize_series(pd.Series(["Dr. Müller-Straße 123", "Herr König"]))
+    0    dr muellerstr 123
+    1          herr koenig
+    dtype: object
     """
-    replacements = ABBREVIATION_TRANSLATION | MUTATION_TRANSLATION
-    text = reduce(lambda t, kv: re.sub(kv[0], kv[1], t), replacements.items(), text)
-    return re.sub(r"[^\w\s]", "", text.lower().strip())
+    unique_values = pd.Series(series.unique(), dtype=object)
+    normalized_values = (
+        unique_values
+        .str.lower()
+        .str.strip()
+        .str.replace(_REPLACEMENT_PATTERN, lambda m: _REPLACEMENTS.get(m.group(0), ""), regex=True)
+        .str.translate(MUTATION_TABLE)
+    )
+    return series.map(dict(zip(unique_values, normalized_values)))
 
 
 if __name__ == '__main__':
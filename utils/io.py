@@ -12,8 +12,12 @@ _to_csv(df, path)
     Saves a DataFrame to a CSV file at the specified path using semicolon (;) as a separator.
 _from_csv(path)
     Reads a CSV file from the specified path into a DataFrame, using semicolon (;) as a separator.
+_to_parquet(df, path)
+    Saves a DataFrame to a zstd-compressed Parquet file at the specified path.
+_from_validated(path)
+    Reads a validated Parquet or CSV file from the specified path into a DataFrame.
 export_data_for_validation(df, input_file, column, algorithm)
-    Exports data to a CSV file for validation purposes, using a structured directory format.
+    Exports data to a CSV or Parquet file for validation purposes, using a structured directory format.
 export_eval_data(df, dataset_name)
     Saves evaluation results to a CSV file for a given dataset name.
 load_validated_data(dataset_name)
@@ -30,14 +34,22 @@ SystemExit
 """
 
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 from os import PathLike, listdir, path
+from pathlib import Path
 from datetime import date
+from functools import lru_cache
+from itertools import chain, islice
+from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
 
-from config.config import DATA_DIR, VALIDATION_DIR, FIGURES_DIR, CONF_MAT_DIR
+from config.logger import Logger
+from config.config import MAX_IO_WORKERS, EXPORT_FORMAT, DATA_DIR, VALIDATION_DIR, FIGURES_DIR, CONF_MAT_DIR
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 
 def _to_csv(df: pd.DataFrame, path: str | PathLike[str]) -> None:
@@ -79,16 +91,88 @@ def _from_csv(path: str | PathLike[str]) -> pd.DataFrame:
     pd.DataFrame
         The loaded DataFrame.
     """
+    # The C parser is kept on purpose: unlike the pyarrow engine it keeps date-like columns as
+    # strings and pads short rows of raw input files with NaN instead of raising
     return pd.read_csv(path, sep=";", encoding="utf-8", index_col=0)
 
 
+def _to_parquet(df: pd.DataFrame, path: str | PathLike[str]) -> None:
+    """
+    Save a DataFrame to a Parquet file.
+
+    This function saves the given DataFrame to a Parquet file at the specified path, using
+    the pyarrow engine and zstd compression.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame to be saved.
+    path : str or PathLike
+        The path to save the Parquet file.
+
+    Returns
+    -------
+    None
+    """
+    df.to_parquet(path, engine="pyarrow", compression="zstd", index=True)
+    return
+
+
+def _from_validated(path: Path) -> pd.DataFrame:
+    """
+    Load a validated file into a DataFrame.
+
+    This function reads a validated Parquet file, or a CSV file with the default
+    comma separator, from the specified path into a DataFrame.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The path to the Parquet or CSV file.
+
+    Returns
+    -------
+    pd.DataFrame
+        The loaded DataFrame.
+    """
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path, engine="pyarrow")
+    return pd.read_csv(path, index_col=0)
+
+
+@lru_cache(maxsize=None)
+def __validation_dir(dataset_prefix: str, column: str) -> Path:
+    """
+    Get the validation directory of a dataset and column.
+
+    The directory is created on the first call and the path is cached, so repeated
+    exports of the same dataset and column neither rebuild it nor touch the filesystem.
+
+    Parameters
+    ----------
+    dataset_prefix : str
+        The first 13 characters of the input file name.
+    column : str
+        The column name being validated.
+
+    Returns
+    -------
+    pathlib.Path
+        The existing directory for the files awaiting validation.
+    """
+    validation_dir = VALIDATION_DIR / dataset_prefix / column
+    validation_dir.mkdir(parents=True, exist_ok=True)
+    return validation_dir
+
+
 def export_data_for_validation(df: pd.DataFrame, input_file: str, column: str, algorithm: str) -> pd.DataFrame:
     """
     Export data for validation purposes.
 
-    This function saves the DataFrame to a CSV file in a structured directory format
-    based on the input file name, column name, and algorithm. The output is stored in
-    the `VALIDATION_DIR`.
+    This function saves the DataFrame to a CSV file, or a Parquet file if `EXPORT_FORMAT`
+    is `"parquet"`, in a structured directory format based on the input file name, column
+    name, and algorithm. The output is stored in the `VALIDATION_DIR`, creating the
+    directory if needed.
 
     Parameters
     ----------
@@ -107,7 +191,11 @@ def export_data_for_validation(df: pd.DataFrame, input_file: str, column: str, a
         The original DataFrame.
     """
     df.columns = ["MATCH", *[f"{algorithm}_{col}" for col in df.columns][1:]]
-    _to_csv(df, VALIDATION_DIR.joinpath(input_file[:13]).joinpath(column).joinpath(f"{date.today()}_{algorithm}_NEED_VALIDATION.csv"))
+    file_path = __validation_dir(input_file[:13], column) / f"{date.today()}_{algorithm}_NEED_VALIDATION.{EXPORT_FORMAT}"
+    if EXPORT_FORMAT == "parquet":
+        _to_parquet(df, file_path)
+    else:
+        _to_csv(df, file_path)
     return df
 
 
@@ -134,13 +222,47 @@ def export_eval_data(df: pd.DataFrame, dataset_name: str) -> pd.DataFrame:
     return df
 
 
+def __validated_files(validated_dir: Path) -> list[Path]:
+    """
+    Collect the validated files of a directory.
+
+    If a file exists both as CSV and as Parquet, the more recently modified one is used
+    and a warning is logged, as the other copy may lack manually validated labels.
+
+    Parameters
+    ----------
+    validated_dir : pathlib.Path
+        The directory containing the validated files.
+
+    Returns
+    -------
+    list of pathlib.Path
+        The validated files of the directory, one per file name.
+    """
+    files = {file.stem: file for file in validated_dir.glob("*.csv") if file.is_file()}
+    for file in validated_dir.glob("*.parquet"):
+        if not file.is_file():
+            continue
+        csv_file = files.get(file.stem)
+        if csv_file is None:
+            files[file.stem] = file
+            continue
+
+        newer_file, older_file = sorted((file, csv_file), key=lambda f: f.stat().st_mtime, reverse=True)
+        Logger(__name__).info(f"{file.stem} exists as CSV and Parquet in {validated_dir}, "
+                              f"using the newer {newer_file.name} and ignoring {older_file.name}.")
+        files[file.stem] = newer_file
+    return list(files.values())
+
+
 def load_validated_data(dataset_name) -> pd.DataFrame:
     """
     Load validated data from multiple directories.
 
-    This function searches for validated CSV files in subdirectories of the `VALIDATION_DIR`
-    that match the specified dataset name. It merges all matching files into a single
-    DataFrame, avoiding duplicate columns.
+    This function searches for validated Parquet and CSV files in subdirectories of the
+    `VALIDATION_DIR` that match the specified dataset name, using the newer copy and
+    warning when a file exists in both formats. The files are read concurrently by up to
+    `MAX_IO_WORKERS` threads and merged into a single DataFrame, avoiding duplicate columns.
 
     Parameters
     ----------
@@ -153,16 +275,23 @@ def load_validated_data(dataset_name) -> pd.DataFrame:
         The merged DataFrame containing all validated data.
     """
     dynamic_dirs = [d for d in VALIDATION_DIR.iterdir() if d.is_dir()]
+    files_per_dir = [__validated_files(dn_dir / dataset_name / "validated") for dn_dir in dynamic_dirs]
+
+    # the files are independent, so their reads and parsing overlap in a small thread pool
+    with ThreadPoolExecutor(max_workers=MAX_IO_WORKERS) as executor:
+        loaded_dfs = iter(executor.map(_from_validated, chain.from_iterable(files_per_dir)))
 
     list_of_dfs = []
-    for dn_dir in dynamic_dirs:
-        validated_dir = dn_dir / dataset_name / "validated"
-        csv_files = [file for file in validated_dir.glob("*.csv") if file.is_file()]
-        dfs = [pd.read_csv(csv_file, index_col=0) for csv_file in csv_files]
+    for files in files_per_dir:
+        dfs, seen_columns = [], set()
+        for df in islice(loaded_dfs, len(files)):
+            # drop columns an earlier file already provided before concatenating, instead of
+            # copying them into the merged frame and deduplicating it afterwards
+            df = df.loc[:, ~df.columns.isin(seen_columns)]
+            seen_columns.update(df.columns)
+            dfs.append(df)
         if dfs:
-            merged_df = pd.concat(dfs, axis=1, join="outer")
-            merged_df = merged_df.loc[:, ~merged_df.columns.duplicated()]
-            list_of_dfs.append(merged_df)
+            list_of_dfs.append(pd.concat(dfs, axis=1, join="outer"))
 
     if list_of_dfs:
         DATA = pd.concat(list_of_dfs, axis=0, ignore_index=True)
@@ -172,12 +301,39 @@ def load_validated_data(dataset_name) -> pd.DataFrame:
     return DATA
 
 
-def plot_metrics(df: pd.DataFrame, dataset_name: str) -> plt.Figure:
+def __new_figure(figsize: tuple[float, float]) -> "Figure":
+    """
+    Create a figure rendered by the Agg backend.
+
+    matplotlib is imported here instead of at module level, so data-only imports of
+    this module do not pay for loading it.
+
+    Parameters
+    ----------
+    figsize : tuple of float
+        The width and height of the figure in inches.
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        A new figure attached to an Agg canvas.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def plot_metrics(df: pd.DataFrame, dataset_name: str) -> "Figure":
     """
     Create a bar plot of evaluation metrics for each algorithm.
 
     This function generates a bar plot from a DataFrame containing evaluation metrics
-    and saves it as a PNG image in the `FIGURES_DIR`.
+    and saves it as a PNG image in the `FIGURES_DIR`. The figure is not registered with
+    pyplot, so it is freed as soon as the caller drops it, and is always rendered by the
+    non-interactive Agg backend.
 
     Parameters
     ----------
@@ -188,25 +344,28 @@ def plot_metrics(df: pd.DataFrame, dataset_name: str) -> plt.Figure:
 
     Returns
     -------
-    plt.Figure
+    matplotlib.figure.Figure
         The matplotlib Figure object of the created plot.
     """
-    fig, ax = plt.subplots(figsize=(10, 7))
+    fig = __new_figure(figsize=(10, 7))
+    ax = fig.subplots()
     df.T.plot(kind="bar", ax=ax, title=f"Evaluation metrics for each algorithm on {dataset_name}")
     ax.set_ylabel("Score")
     ax.set_xticklabels(ax.get_xticklabels(), rotation=15)
-    plt.tight_layout()
+    fig.tight_layout()
 
-    plt.savefig(FIGURES_DIR.joinpath(f"{date.today()}_{dataset_name}_eval_results.png"))
+    fig.savefig(FIGURES_DIR.joinpath(f"{date.today()}_{dataset_name}_eval_results.png"))
     return fig
 
 
-def plot_confusion_matrix(confusion_matrix, algorithm: str, dataset_name: str) -> plt.Figure:
+def plot_confusion_matrix(confusion_matrix, algorithm: str, dataset_name: str) -> "Figure":
     """
     Create a confusion matrix heatmap.
 
     This function generates a heatmap from a given confusion matrix and saves it as a
-    PNG image in the `CONF_MAT_DIR`.
+    PNG image in the `CONF_MAT_DIR`. The figure is not registered with pyplot, so it is
+    freed as soon as the caller drops it, and is always rendered by the non-interactive
+    Agg backend.
 
     Parameters
     ----------
@@ -219,17 +378,24 @@ def plot_confusion_matrix(confusion_matrix, algorithm: str, dataset_name: str) -
 
     Returns
     -------
-    plt.Figure
+    matplotlib.figure.Figure
         The matplotlib Figure object of the created heatmap.
     """
-    fig, ax = plt.subplots(figsize=(5, 4))
-    sns.heatmap(confusion_matrix, annot=True, fmt="d", cmap="Blues", xticklabels=["False", "True"],
-                yticklabels=["False", "True"])
-    plt.title(f"Confusion Matrix for {algorithm} on {dataset_name}")
+    fig = __new_figure(figsize=(5, 4))
+    ax = fig.subplots()
+    image = ax.imshow(confusion_matrix, cmap="Blues")
+    fig.colorbar(image, ax=ax)
+    ax.set_xticks([0, 1], ["False", "True"])
+    ax.set_yticks([0, 1], ["False", "True"])
+    # dark cells get white annotations, like a seaborn heatmap
+    threshold = (np.max(confusion_matrix) + np.min(confusion_matrix)) / 2
+    for (i, j), value in np.ndenumerate(confusion_matrix):
+        ax.text(j, i, f"{value:d}", ha="center", va="center", color="white" if value > threshold else "black")
+    ax.set_title(f"Confusion Matrix for {algorithm} on {dataset_name}")
     ax.set_xlabel("Predicted")
     ax.set_ylabel("Actual")
 
-    plt.savefig(CONF_MAT_DIR.joinpath(f"{date.today()}_{dataset_name}_cm_{algorithm}.png"))
+    fig.savefig(CONF_MAT_DIR.joinpath(f"{date.today()}_{dataset_name}_cm_{algorithm}.png"))
     return fig
 
 